@@ -15,17 +15,15 @@ std::string Configuration::remove_whitespace(const std::string& str) {
     return result;
 }
 
+// Expects input that has already been through remove_whitespace.
 std::tuple<int, int> Configuration::split_by_comma(const std::string& input) {
-    std::string cleaned = remove_whitespace(input);
-    std::stringstream ss(cleaned);
-    std::string part1, part2;
-
-    if (!std::getline(ss, part1, ',') || !std::getline(ss, part2)) {
+    auto commaPos = input.find(',');
+    if (commaPos == std::string::npos || commaPos + 1 == input.size()) {
         throw std::invalid_argument("Invalid input format. Expected two comma-separated values.");
     }
 
-    int val1 = std::stoi(part1);
-    int val2 = std::stoi(part2);
+    int val1 = std::stoi(input.substr(0, commaPos));
+    int val2 = std::stoi(input.substr(commaPos + 1));
 
     return std::make_tuple(val1, val2);
 }
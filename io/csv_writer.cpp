@@ -64,9 +64,10 @@ void BufferedCSVWriter::writeRow(int rpm, double speed, int gear, int revMatch,
 
 void BufferedCSVWriter::flush()
 {
-    if (!buffer.str().empty())
+    std::string_view pending = buffer.view();
+    if (!pending.empty())
     {
-        file << buffer.str();
+        file << pending;
         file.flush();
         buffer.str("");
         buffer.clear();
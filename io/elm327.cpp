@@ -2,8 +2,9 @@
 #include <chrono>
 #include "elm327.hpp"
 
-ELM327Interface::ELM327Interface(const std::string &portName, unsigned int baudRate)
-    : serial(io)
+ELM327Interface::ELM327Interface(const std::string &portName, unsigned int baudRate, bool debug)
+    : serial(io),
+      debugMode(debug)
 {
     try
     {
@@ -81,8 +82,9 @@ std::string ELM327Interface::messageReadOBD(const std::string_view cmd,
     std::istream is(&response_buf);
     while (std::getline(is, input))
     {
-        input.erase(std::remove(input.begin(), input.end(), ' '), input.end());
-        input.erase(std::remove(input.begin(), input.end(), '\r'), input.end());
+        input.erase(std::remove_if(input.begin(), input.end(),
+                                   [](char c) { return c == ' ' || c == '\r'; }),
+                    input.end());
         response += input;
     }
 
@@ -96,7 +98,7 @@ std::string ELM327Interface::messageReadOBD(const std::string_view cmd,
 
 Result<std::tuple<int, int, int, int, long long>> ELM327Interface::getEngineData(const SignalHandler &handler, std::string_view cmd = "01 0C 0D 04 11 05 4\r")
 {
-    std::string response = messageReadOBD("01 0C 0D 04 11 05 4\r", true);
+    std::string response = messageReadOBD("01 0C 0D 04 11 05 4\r", debugMode);
 
     size_t pos = response.find("0C");
     int rpm = -1, speedMph = -1, load = -1, throttle = -1;
@@ -221,36 +223,48 @@ void DummyELM327::loadTestData()
         if (line.empty() || line[0] == '#')
             continue;
 
-        std::stringstream ss(line);
-        std::string token;
-        std::vector<int> intValues;
+        std::string_view rest(line);
+        int rpm = 0, mph = 0;
         long long timestamp = 0;
-        intValues.reserve(6); 
 
+        // Only RPM, MPH and Time are replayed; the other columns are skipped unparsed.
         int tokenIndex = 0;
-        while (std::getline(ss, token, ','))
+        while (true)
         {
-            try
+            size_t commaPos = rest.find(',');
+            std::string_view token = rest.substr(0, commaPos);
+            const char *first = token.data();
+            const char *last = first + token.size();
+
+            std::errc ec{};
+            if (tokenIndex == 0)
+            {
+                ec = std::from_chars(first, last, rpm).ec;
+            }
+            else if (tokenIndex == 1)
+            {
+                ec = std::from_chars(first, last, mph).ec;
+            }
+            else if (tokenIndex == 6)
             {
-                if (tokenIndex < 6)
-                {
-                    intValues.push_back(std::stoi(token));
-                }
-                else if (tokenIndex == 6)
-                {
-                    timestamp = std::stoll(token);
-                }
-                tokenIndex++;
+                ec = std::from_chars(first, last, timestamp).ec;
             }
-            catch (const std::exception &)
+            if (ec != std::errc{})
+            {
+                break;
+            }
+            tokenIndex++;
+
+            if (commaPos == std::string_view::npos || commaPos + 1 == rest.size())
             {
                 break;
             }
+            rest.remove_prefix(commaPos + 1);
         }
 
-        if (intValues.size() == 6 && tokenIndex == 7)
+        if (tokenIndex == 7)
         {
-            testData.emplace_back(intValues[0], intValues[1], timestamp);
+            testData.emplace_back(rpm, mph, timestamp);
         }
     }
 
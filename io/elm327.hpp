@@ -37,9 +37,10 @@ class ELM327Interface : public ELM327Base
 private:
     boost::asio::io_context io;
     boost::asio::serial_port serial;
+    bool debugMode;
 
 public:
-    ELM327Interface(const std::string& portName, unsigned int baudRate);
+    ELM327Interface(const std::string& portName, unsigned int baudRate, bool debug = false);
     ~ELM327Interface();
     bool isConnected() const override;
     Result<std::tuple<int, int, int, int, long long>> getEngineData(const SignalHandler& handler, std::string_view cmd) override;
@@ -33,12 +33,19 @@ class GearBox
 {
 public:
     explicit GearBox(const Configuration::GearConfig& config)
-        : gearRatios(config.gear_ratios),
+        : myfile("logs/temp.txt", std::ofstream::app),
+          gearRatios(config.gear_ratios),
           finalDrive(config.final_drive.value()),
           wheelCircumference(config.wheel_circumference.value()),
           minRPM(config.min_rpm.value()),
-          maxRPM(config.max_rpm.value())
+          maxRPM(config.max_rpm.value()),
+          rpmPerMph(TIRE_CONVERSION * finalDrive / wheelCircumference)
     {
+        gearRpmPerMph.reserve(gearRatios.size());
+        for (double ratio : gearRatios) {
+            gearRpmPerMph.push_back(rpmPerMph * ratio);
+        }
+
         std::cout << "Final Drive Ratio: " << finalDrive << "\nGear Ratios:\n";
         for (size_t i = 0; i < gearRatios.size(); ++i) {
             std::cout << "  Gear " << i+1 << ": " << gearRatios[i] << '\n';
@@ -52,8 +59,9 @@ public:
         auto [dR, dM] = getDerivatives(rpm, MPH, now);
         bool diverging = (dR * dM <= 0);
         bool rpmDecrease = (dR < 0);
+        bool accelerating = !(diverging || rpmDecrease);
         
-        int currentGear = !(diverging || rpmDecrease) ? getCurrentGear(rpm, MPH) : previousGear;
+        int currentGear = accelerating ? getCurrentGear(rpm, MPH) : previousGear;
         previousGear = currentGear;
         
         if (currentGear < 2)
@@ -66,14 +74,11 @@ public:
             // {
                 //     std::cout << static_cast<int>((TIRE_CONVERSION * MPH * finalDrive * g) / wheelCircumference) << "  ";
                 // }
-                int cRPM = static_cast<int>((TIRE_CONVERSION * MPH * finalDrive * gearRatios[currentGear - 1]) / wheelCircumference);
-                if (!(diverging || rpmDecrease)){
-
-                    myfile.open("logs/temp.txt", std::ofstream::app);
+                int cRPM = static_cast<int>(MPH * gearRpmPerMph[currentGear - 1]);
+                if (accelerating){
                     myfile << currentGear << "  " << ((static_cast<double>(rpm-cRPM)/rpm))*100<< '\n';
-                    myfile.close();
                 }
-                int targetRPM = static_cast<int>((TIRE_CONVERSION * MPH * finalDrive * gearRatios[currentGear - 2]) / wheelCircumference);
+                int targetRPM = static_cast<int>(MPH * gearRpmPerMph[currentGear - 2]);
                 if (targetRPM < minRPM || targetRPM > maxRPM)
                 {
                     return {currentGear, -1};
@@ -94,6 +99,8 @@ private:
     int maxRPM;
     double TIRE_CONVERSION = 1056.0;
     double KMH_TO_MPH = 0.621371;
+    double rpmPerMph; // engine RPM per MPH at a 1:1 gear ratio
+    std::vector<double> gearRpmPerMph; // engine RPM per MPH in each gear, indexed like gearRatios
     int previousGear = 1;
     struct DataPoint {
         int64_t timestamp;
@@ -114,7 +121,7 @@ private:
         if (mph == 0) {
             return 1;
         }
-        double currentRatioValue = ((rpm * wheelCircumference) / (mph * TIRE_CONVERSION)) / finalDrive;
+        double currentRatioValue = rpm / (mph * rpmPerMph);
         if (currentRatioValue >= gearRatios[0]) {
             return 1;
         }
@@ -141,15 +148,16 @@ private:
         double rpmSum = 0.0;
         double mphSum = 0.0;
         
+        const DataPoint* p1 = &buffer[start];
         for (size_t i = 1; i < count; ++i) {
-            const auto& p1 = buffer[(start + i - 1) % MAX_POINTS];
-            const auto& p2 = buffer[(start + i) % MAX_POINTS];
+            const DataPoint* p2 = &buffer[(start + i) % MAX_POINTS];
             
-            int64_t dt = p2.timestamp - p1.timestamp;
+            int64_t dt = p2->timestamp - p1->timestamp;
             if (dt > 0) {
-                rpmSum += static_cast<double>(p2.rpm - p1.rpm) / dt;
-                mphSum += static_cast<double>(p2.mph - p1.mph) / dt;
+                rpmSum += static_cast<double>(p2->rpm - p1->rpm) / dt;
+                mphSum += static_cast<double>(p2->mph - p1->mph) / dt;
             }
+            p1 = p2;
         }
         
         return {rpmSum / (count - 1), mphSum / (count - 1)};
@@ -182,7 +190,7 @@ private:
 
 
 
-std::unique_ptr<ELM327Base> createELM327Interface(bool testMode, const std::string &port = "COM9", int baudRate = 38400)
+std::unique_ptr<ELM327Base> createELM327Interface(bool testMode, const std::string &port = "COM9", int baudRate = 38400, bool debugMode = false)
 {
     if (testMode)
     {
@@ -190,7 +198,7 @@ std::unique_ptr<ELM327Base> createELM327Interface(bool testMode, const std::stri
     }
     else
     {
-        return std::make_unique<ELM327Interface>(port, baudRate);
+        return std::make_unique<ELM327Interface>(port, baudRate, debugMode);
     }
 }
 
@@ -229,7 +237,7 @@ int main(int argc, char *argv[])
     try {
         GearBox gearBox(finalConfig.gear);
         auto csvWriter = createBufferedCSVWriter(finalConfig.app.output_path, finalConfig.app.test_mode, finalConfig.app.debug_mode);
-        auto elm = createELM327Interface(finalConfig.app.test_mode, finalConfig.app.serial_port, finalConfig.app.baud_rate);
+        auto elm = createELM327Interface(finalConfig.app.test_mode, finalConfig.app.serial_port, finalConfig.app.baud_rate, finalConfig.app.debug_mode);
 
         if (!elm->isConnected()) {
             std::cerr << "Failed to connect to ELM327 device\n";